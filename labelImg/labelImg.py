@@ -1,18 +1,16 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
-import argparse
-import codecs
 import distutils.spawn
 import os.path
 import platform
 import re
 import sys
-import subprocess
+import time
 import shutil
 import webbrowser as wb
 
-from functools import partial
-from collections import defaultdict
+from functools import partial, lru_cache
+from collections import defaultdict, deque, OrderedDict
 
 try:
     from PyQt5.QtGui import *
@@ -29,7 +27,6 @@ except ImportError:
     from PyQt4.QtGui import *
     from PyQt4.QtCore import *
 
-from libs.combobox import ComboBox
 from libs.resources import *
 from libs.constants import *
 from libs.utils import *
@@ -49,10 +46,43 @@ from libs.yolo_io import TXT_EXT
 from libs.create_ml_io import CreateMLReader
 from libs.create_ml_io import JSON_EXT
 from libs.ustr import ustr
-from libs.hashableQListWidgetItem import HashableQListWidgetItem
 
 __appname__ = 'labelImg'
 
+# Upper bound on cached annotation parses kept for fast prev/next navigation
+ANNOTATION_CACHE_SIZE = 512
+
+# How long a cached recent-file existence check stays authoritative
+RECENT_EXISTS_TTL = 5.0
+
+# Directory scans remembered for quick re-import of recently used folders
+SCAN_CACHE_SIZE = 8
+
+# MIME type carrying serialized shapes on the system clipboard
+SHAPES_MIME_TYPE = 'application/x-labelimg-shapes'
+
+# Item data role carrying the shape id that links a label-list item to
+# its shape, so plain QListWidgetItems can be used as mapping keys
+SHAPE_ID_ROLE = Qt.UserRole + 1
+
+# (menu title, icon name) per save format, built once at import time
+FORMAT_META = {
+    LabelFileFormat.PASCAL_VOC: ('&PascalVOC', 'format_voc'),
+    LabelFileFormat.YOLO: ('&YOLO', 'format_yolo'),
+    LabelFileFormat.CREATE_ML: ('&CreateML', 'format_createml'),
+}
+
+
+class SilentStatusBar(QStatusBar):
+    """Status bar that drops transient messages instead of drawing them.
+
+    Only permanently added widgets (the version label) are shown; skipping
+    showMessage avoids a relayout and repaint on every status update.
+    """
+
+    def showMessage(self, *args, **kwargs):
+        pass
+
 
 class WindowMixin(object):
 
@@ -75,6 +105,92 @@ class WindowMixin(object):
         return toolbar
 
 
+class DirScanWorker(QObject):
+    """Scans a directory for images off the GUI thread.
+
+    Emits `batch_ready` with sorted image paths in chunks so the file list
+    can be populated incrementally, then `finished` once the walk is done.
+    """
+
+    batch_ready = pyqtSignal(list)
+    finished = pyqtSignal()
+
+    BATCH_SIZE = 200
+
+    def __init__(self, folder_path, scan):
+        super(DirScanWorker, self).__init__()
+        self.folder_path = folder_path
+        self.scan = scan
+
+    def run(self):
+        images = self.scan(self.folder_path)
+        for start in range(0, len(images), self.BATCH_SIZE):
+            self.batch_ready.emit(images[start:start + self.BATCH_SIZE])
+        self.finished.emit()
+
+
+class ImageLoadSignals(QObject):
+    # (sequence number, file path, decoded QImage or None on failure)
+    loaded = pyqtSignal(int, str, object)
+
+
+class ImageLoadTask(QRunnable):
+    """Reads and decodes an image file on a pool thread.
+
+    QImage decoding is thread-safe, so both the disk read and the (often
+    slower) decompression happen off the GUI thread. The sequence number
+    lets the receiver drop results from a navigation that has since been
+    superseded.
+    """
+
+    def __init__(self, seq, file_path, signals):
+        super(ImageLoadTask, self).__init__()
+        self.seq = seq
+        self.file_path = file_path
+        self.signals = signals
+
+    def run(self):
+        self.signals.loaded.emit(self.seq, self.file_path,
+                                 read(self.file_path, None))
+
+
+class RecentFileStatTask(QRunnable):
+    """Refreshes one entry of the recent-file existence cache.
+
+    Stale menu entries keep using the cached answer; this task re-stats
+    the path off the GUI thread so the next menu open sees fresh data.
+    """
+
+    def __init__(self, path, cache):
+        super(RecentFileStatTask, self).__init__()
+        self.path = path
+        self.cache = cache
+
+    def run(self):
+        self.cache[self.path] = (time.time(), os.path.exists(self.path))
+
+
+class PrefetchTask(QRunnable):
+    """Warms the OS page cache for files the user is about to open.
+
+    The bytes are read and discarded; the follow-up real load then hits
+    cached pages instead of disk.
+    """
+
+    def __init__(self, file_paths):
+        super(PrefetchTask, self).__init__()
+        self.file_paths = file_paths
+
+    def run(self):
+        for path in self.file_paths:
+            try:
+                with open(path, 'rb') as f:
+                    while f.read(1 << 20):
+                        pass
+            except (IOError, OSError):
+                pass
+
+
 class MainWindow(QMainWindow, WindowMixin):
     FIT_WINDOW, FIT_WIDTH, MANUAL_ZOOM = list(range(3))
 
@@ -89,9 +205,10 @@ class MainWindow(QMainWindow, WindowMixin):
 
         self.os_name = platform.system()
 
-        # Load string bundle for i18n
+        # Load string bundle for i18n. The bundle is immutable once built,
+        # so the ~80 lookups made while constructing actions are memoized.
         self.string_bundle = StringBundle.get_bundle()
-        get_str = lambda str_id: self.string_bundle.get_string(str_id)
+        get_str = lru_cache(maxsize=256)(self.string_bundle.get_string)
 
         # Save as Pascal voc xml
         self.default_save_dir = default_save_dir
@@ -99,7 +216,26 @@ class MainWindow(QMainWindow, WindowMixin):
 
         # For loading all image under a directory
         self.m_img_list = []
+        self._img_index = {}  # path -> position in m_img_list
+        # Computed once; read-only thereafter, so the scan worker thread
+        # can share it safely.
+        self._img_ext_set = frozenset(
+            '.%s' % fmt.data().decode("ascii").lower()
+            for fmt in QImageReader.supportedImageFormats())
+        # Glob list for the open-file dialog; only the (dynamic) label
+        # suffix is appended per use.
+        self._img_format_globs = ' '.join(
+            '*.%s' % fmt.data().decode("ascii").lower()
+            for fmt in QImageReader.supportedImageFormats())
         self.dir_name = None
+        self._scan_thread = None
+        self._scan_worker = None
+        self._load_seq = 0
+        # Path whose ImageLoadTask is still in flight; navigation uses it
+        # so a half-finished load still counts as the current position
+        self._pending_load_path = None
+        self._image_load_signals = ImageLoadSignals()
+        self._image_load_signals.loaded.connect(self._image_loaded)
         self.label_hist = []
         self.last_open_dir = None
         self.cur_img_idx = 0
@@ -113,11 +249,21 @@ class MainWindow(QMainWindow, WindowMixin):
         self.screencast = "https://youtu.be/p0nR2YsCY_U"
 
         # Clipboard for copy/paste functionality
-        self.clipboard = []
-        self.clipboard_source_image = None  # Track which image the boxes were copied from
+
+        # LRU cache of parsed annotation files, so navigating back to an
+        # already-visited image does not re-parse XML/TXT/JSON from disk
+        self._annotation_cache = OrderedDict()
+
+        # Scan results per (folder, mtime); re-importing an unchanged
+        # folder skips the filesystem walk entirely
+        self._scan_cache = OrderedDict()
+
+        # Cached save-dir listings for annotation existence checks
+        self._dir_listing_cache = {}
 
         # Color palette for per-class colors
         self.class_colors = {}  # Dictionary to store custom colors per class
+        self._label_brush_cache = {}  # Memoized QBrush per class for list items
 
         # Load predefined classes to the list
         self.load_predefined_classes(default_prefdef_class_file)
@@ -125,8 +271,11 @@ class MainWindow(QMainWindow, WindowMixin):
         # Main widgets and related state.
         self.label_dialog = LabelDialog(parent=self, list_item=self.label_hist)
 
-        self.items_to_shapes = {}
-        self.shapes_to_items = {}
+        # Shapes are keyed by a monotonically increasing id; the id also
+        # rides on each list item under SHAPE_ID_ROLE.
+        self.items_to_shapes = BiDict()
+        self._item_by_sid = {}
+        self._next_shape_id = 0
         self.prev_label_text = ''
 
         list_layout = QVBoxLayout()
@@ -162,6 +311,12 @@ class MainWindow(QMainWindow, WindowMixin):
         self.bbox_thickness_spinbox.setDecimals(1)
         self.bbox_thickness_spinbox.setValue(2.0)  # Default value
         self.bbox_thickness_spinbox.valueChanged.connect(self.bbox_thickness_changed)
+        # Held-down spin arrows fire valueChanged rapidly; repaint at most
+        # once per frame while the thickness settles.
+        self._thickness_update_timer = QTimer(self)
+        self._thickness_update_timer.setSingleShot(True)
+        self._thickness_update_timer.setInterval(16)
+        self._thickness_update_timer.timeout.connect(self.canvas_update)
         bbox_thickness_layout = QHBoxLayout()
         bbox_thickness_layout.setContentsMargins(0, 0, 0, 0)
         bbox_thickness_layout.setSpacing(5)
@@ -179,12 +334,17 @@ class MainWindow(QMainWindow, WindowMixin):
         self.class_visibility_list.itemChanged.connect(self.class_visibility_changed)
         self.class_visibility_list.itemClicked.connect(self.class_visibility_item_clicked)
 
+        # Items already present in the visibility list, keyed by class name,
+        # so presence checks don't rescan the widget
+        self._visibility_items = {}
+
         # Add "Show All" option
         show_all_item = QListWidgetItem("Show All")
         show_all_item.setFlags(show_all_item.flags() | Qt.ItemIsUserCheckable)
         show_all_item.setCheckState(Qt.Checked)  # Default checked
         show_all_item.setData(Qt.UserRole, "")  # Empty string means show all
         self.class_visibility_list.addItem(show_all_item)
+        self._visibility_items[""] = show_all_item
 
         class_visibility_layout = QVBoxLayout()
         class_visibility_layout.setContentsMargins(0, 5, 0, 0)
@@ -249,7 +409,7 @@ class MainWindow(QMainWindow, WindowMixin):
         self.file_dock.setWidget(file_list_container)
 
         self.zoom_widget = ZoomWidget()
-        self.color_dialog = ColorDialog(parent=self)
+        self.color_dialog = None  # constructed in _init_deferred
 
         self.canvas = Canvas(parent=self)
         self.canvas.zoomRequest.connect(self.zoom_request)
@@ -308,20 +468,10 @@ class MainWindow(QMainWindow, WindowMixin):
         save = action(get_str('save'), self.save_file,
                       'Ctrl+S', 'save', get_str('saveDetail'), enabled=False)
 
-        def get_format_meta(format):
-            """
-            returns a tuple containing (title, icon_name) of the selected format
-            """
-            if format == LabelFileFormat.PASCAL_VOC:
-                return '&PascalVOC', 'format_voc'
-            elif format == LabelFileFormat.YOLO:
-                return '&YOLO', 'format_yolo'
-            elif format == LabelFileFormat.CREATE_ML:
-                return '&CreateML', 'format_createml'
-
-        save_format = action(get_format_meta(self.label_file_format)[0],
+        format_title, format_icon = FORMAT_META[self.label_file_format]
+        save_format = action(format_title,
                              self.change_format, 'Ctrl+',
-                             get_format_meta(self.label_file_format)[1],
+                             format_icon,
                              get_str('changeSaveFormat'), enabled=True)
 
         save_as = action(get_str('saveAs'), self.save_file_as,
@@ -528,19 +678,29 @@ class MainWindow(QMainWindow, WindowMixin):
         self.addAction(open_next_image)
         self.addAction(open_prev_image)
 
-        # Status bar will show version label permanently, no startup message needed
+        # Status bar will show version label permanently; transient
+        # messages are suppressed by the SilentStatusBar subclass.
+        self.setStatusBar(SilentStatusBar(self))
         self.statusBar().show()
 
-        # Override showMessage to disable all status messages
-        self._original_showMessage = self.statusBar().showMessage
-        self.statusBar().showMessage = lambda *args, **kwargs: None  # Disable all status messages
-
         # Application state.
         self.image = QImage()
         self.file_path = ustr(default_filename)
         self.last_open_dir = None
-        self.recent_files = []
         self.max_recent = 7
+        # Bounded deque: appending past maxlen drops the oldest entry
+        self.recent_files = deque(maxlen=self.max_recent)
+        self._recent_exists_cache = {}  # path -> (checked at, exists)
+        # Fixed pool of menu actions for recent files; update_file_menu
+        # retitles and shows/hides these instead of recreating QActions.
+        self._recent_paths = []
+        self._recent_action_pool = []
+        recent_icon = new_icon('labels')
+        for i in range(self.max_recent):
+            recent_action = QAction(recent_icon, '', self)
+            recent_action.triggered.connect(partial(self.load_recent_index, i))
+            recent_action.setVisible(False)
+            self._recent_action_pool.append(recent_action)
         self.line_color = None
         self.fill_color = None
         self.zoom_level = 100
@@ -548,22 +708,23 @@ class MainWindow(QMainWindow, WindowMixin):
         # Add Chris
         self.difficult = False
 
-        # Fix the compatible issue for qt4 and qt5. Convert the QStringList to python list
-        if settings.get(SETTING_RECENT_FILES):
-            if have_qstring():
-                recent_file_qstring_list = settings.get(SETTING_RECENT_FILES)
-                self.recent_files = [ustr(i) for i in recent_file_qstring_list]
-            else:
-                self.recent_files = recent_file_qstring_list = settings.get(SETTING_RECENT_FILES)
+        # Recent files are stored as one newline-joined string; older
+        # settings files may still hold a list (or QStringList), so accept
+        # both on load.
+        saved_recent = settings.get(SETTING_RECENT_FILES)
+        if saved_recent:
+            if isinstance(saved_recent, str):
+                saved_recent = saved_recent.split('\n')
+            self.recent_files = deque((ustr(i) for i in saved_recent),
+                                      maxlen=self.max_recent)
 
         size = settings.get(SETTING_WIN_SIZE, QSize(600, 500))
         position = QPoint(0, 0)
         saved_position = settings.get(SETTING_WIN_POSE, position)
         # Fix the multiple monitors issue
-        for i in range(QApplication.desktop().screenCount()):
-            if QApplication.desktop().availableGeometry(i).contains(saved_position):
-                position = saved_position
-                break
+        if any(screen.availableGeometry().contains(saved_position)
+               for screen in QApplication.screens()):
+            position = saved_position
         self.resize(size)
         self.move(position)
         save_dir = ustr(settings.get(SETTING_SAVE_DIR, None))
@@ -591,8 +752,9 @@ class MainWindow(QMainWindow, WindowMixin):
             self.actions.advancedMode.setChecked(True)
             self.toggle_advanced_mode()
 
-        # Populate the File menu dynamically.
-        self.update_file_menu()
+        # Secondary chrome (color dialog, recent-files menu) is not needed
+        # for first paint; build it on the first idle tick instead.
+        self.queue_event(self._init_deferred)
 
         # Since loading the file may take some time, make sure it runs in the background.
         if self.file_path and os.path.isdir(self.file_path):
@@ -601,7 +763,13 @@ class MainWindow(QMainWindow, WindowMixin):
             self.queue_event(partial(self.load_file, self.file_path or ""))
 
         # Callbacks:
-        self.zoom_widget.valueChanged.connect(self.paint_canvas)
+        # Coalesce rapid zoom changes (wheel spins, spin-box repeats) into
+        # one repaint per frame instead of repainting per increment.
+        self._repaint_timer = QTimer(self)
+        self._repaint_timer.setSingleShot(True)
+        self._repaint_timer.setInterval(16)
+        self._repaint_timer.timeout.connect(self.paint_canvas)
+        self.zoom_widget.valueChanged.connect(self.schedule_paint)
 
         self.populate_mode_actions()
 
@@ -617,6 +785,11 @@ class MainWindow(QMainWindow, WindowMixin):
         if self.file_path and os.path.isdir(self.file_path):
             self.open_dir_dialog(dir_path=self.file_path, silent=True)
 
+    def _init_deferred(self):
+        """Finish construction of chrome that first paint does not need."""
+        self.color_dialog = ColorDialog(parent=self)
+        self.update_file_menu()
+
     def keyReleaseEvent(self, event):
         if event.key() == Qt.Key_Control:
             self.canvas.set_drawing_shape_to_square(False)
@@ -695,6 +868,8 @@ class MainWindow(QMainWindow, WindowMixin):
         add_actions(self.tools, self.actions.advanced)
 
     def set_dirty(self):
+        if self.dirty:
+            return
         self.dirty = True
         self.actions.save.setEnabled(True)
 
@@ -703,6 +878,23 @@ class MainWindow(QMainWindow, WindowMixin):
         self.actions.save.setEnabled(False)
         self.actions.create.setEnabled(True)
 
+    def color_for_class(self, label):
+        """Custom color for the class if set, otherwise the generated one.
+
+        Generated colors are stored back into class_colors so each label is
+        hashed at most once.
+        """
+        color = self.class_colors.get(label)
+        if color is None:
+            color = self.class_colors[label] = generate_color_by_text(label)
+        return color
+
+    def _brush_for(self, label):
+        brush = self._label_brush_cache.get(label)
+        if brush is None:
+            brush = self._label_brush_cache[label] = QBrush(self.color_for_class(label))
+        return brush
+
     def toggle_actions(self, value=True):
         """Enable/Disable widgets which depend on an opened image."""
         for z in self.actions.zoomActions:
@@ -718,9 +910,10 @@ class MainWindow(QMainWindow, WindowMixin):
 
     def reset_state(self):
         self.items_to_shapes.clear()
-        self.shapes_to_items.clear()
+        self._item_by_sid.clear()
         self.label_list.clear()
         self.file_path = None
+        self._pending_load_path = None
         self.image_data = None
         self.label_file = None
         self.canvas.reset_state()
@@ -733,11 +926,11 @@ class MainWindow(QMainWindow, WindowMixin):
         return None
 
     def add_recent_file(self, file_path):
-        if file_path in self.recent_files:
+        try:
             self.recent_files.remove(file_path)
-        elif len(self.recent_files) >= self.max_recent:
-            self.recent_files.pop()
-        self.recent_files.insert(0, file_path)
+        except ValueError:
+            pass
+        self.recent_files.appendleft(file_path)
 
     def beginner(self):
         return self._beginner
@@ -810,21 +1003,41 @@ class MainWindow(QMainWindow, WindowMixin):
         self.toggle_draw_mode(True)
         self.label_selection_changed()
 
+    def _recent_file_exists(self, filename):
+        """os.path.exists with a short-lived cache.
+
+        Menu refreshes stat each recent file on every open; hitting slow
+        (network) paths repeatedly is noticeable. Within the TTL the cached
+        answer is returned directly; past it the stale answer is still used
+        but a background re-stat refreshes the entry for the next refresh.
+        """
+        now = time.time()
+        entry = self._recent_exists_cache.get(filename)
+        if entry is not None:
+            if now - entry[0] > RECENT_EXISTS_TTL:
+                QThreadPool.globalInstance().start(
+                    RecentFileStatTask(filename, self._recent_exists_cache))
+            return entry[1]
+        exists = os.path.exists(filename)
+        self._recent_exists_cache[filename] = (now, exists)
+        return exists
+
     def update_file_menu(self):
         curr_file_path = self.file_path
 
-        def exists(filename):
-            return os.path.exists(filename)
+        exists = self._recent_file_exists
         menu = self.menus.recentFiles
         menu.clear()
-        files = [f for f in self.recent_files if f !=
-                 curr_file_path and exists(f)]
-        for i, f in enumerate(files):
-            icon = new_icon('labels')
-            action = QAction(
-                icon, '&%d %s' % (i + 1, QFileInfo(f).fileName()), self)
-            action.triggered.connect(partial(self.load_recent, f))
-            menu.addAction(action)
+        self._recent_paths = [f for f in self.recent_files if f !=
+                              curr_file_path and exists(f)][:self.max_recent]
+        for i, action in enumerate(self._recent_action_pool):
+            if i < len(self._recent_paths):
+                f = self._recent_paths[i]
+                action.setText('&%d %s' % (i + 1, QFileInfo(f).fileName()))
+                action.setVisible(True)
+                menu.addAction(action)
+            else:
+                action.setVisible(False)
 
     def pop_label_list_menu(self, point):
         self.menus.labelList.exec_(self.label_list.mapToGlobal(point))
@@ -839,13 +1052,12 @@ class MainWindow(QMainWindow, WindowMixin):
         if text is not None:
             item.setText(text)
             # Use custom color if set, otherwise generate color
-            item.setBackground(self.class_colors.get(text, generate_color_by_text(text)))
+            item.setBackground(self._brush_for(text))
             self.set_dirty()
-            self.update_combo_box()
 
     # Tzutalin 20160906 : Add file list and dock to move faster
     def file_item_double_clicked(self, item=None):
-        self.cur_img_idx = self.m_img_list.index(ustr(item.text()))
+        self.cur_img_idx = self._img_index[ustr(item.text())]
         filename = self.m_img_list[self.cur_img_idx]
         if filename:
             self.load_file(filename)
@@ -872,24 +1084,22 @@ class MainWindow(QMainWindow, WindowMixin):
         # diffc_button removed - difficult always set to False
         difficult = False
 
-        try:
-            shape = self.items_to_shapes[item]
-        except:
-            pass
+        shape = self._shape_for_item(item) if item else None
+        if shape is None:
+            return
         # Checked and Update
-        try:
-            if difficult != shape.difficult:
-                shape.difficult = difficult
-                self.set_dirty()
-            else:  # User probably changed item visibility
-                self.canvas.set_shape_visible(shape, item.checkState() == Qt.Checked)
-        except:
-            pass
+        if difficult != shape.difficult:
+            shape.difficult = difficult
+            self.set_dirty()
+        else:  # User probably changed item visibility
+            self.canvas.set_shape_visible(shape, item.checkState() == Qt.Checked)
 
     def bbox_thickness_changed(self, value):
         """Update the bounding box line thickness."""
-        from libs.shape import Shape
         Shape.line_width = value
+        self._thickness_update_timer.start()
+
+    def canvas_update(self):
         self.canvas.update()
 
     def class_visibility_item_clicked(self, item):
@@ -923,7 +1133,7 @@ class MainWindow(QMainWindow, WindowMixin):
                             break
 
         # Collect all checked classes from the visibility list
-        selected_classes = []
+        selected_classes = set()
         show_all = False
 
         for i in range(self.class_visibility_list.count()):
@@ -933,38 +1143,44 @@ class MainWindow(QMainWindow, WindowMixin):
                 if class_name == "":  # "Show All" option
                     show_all = True
                     break
-                selected_classes.append(class_name)
-
-        # Hide/show items in label list based on filter, and update canvas visibility
-        for i in range(self.label_list.count()):
-            label_item = self.label_list.item(i)
-            label_text = label_item.text()
+                selected_classes.add(class_name)
+
+        # Hide/show items in label list based on filter, and update canvas
+        # visibility. Each set_shape_visible triggers a repaint and each
+        # setCheckState re-enters this slot via itemChanged, so suspend
+        # canvas updates and list signals for the batch and repaint once.
+        reenable = self.canvas.updatesEnabled()
+        if reenable:
+            self.canvas.setUpdatesEnabled(False)
+        self.label_list.blockSignals(True)
+        checked, unchecked = Qt.Checked, Qt.Unchecked
+        for sid, shape in self.items_to_shapes.items():
+            label_item = self._item_by_sid[sid]
 
             # Show if "Show All" is checked OR label is in selected classes
-            should_show = show_all or label_text in selected_classes
+            should_show = show_all or label_item.text() in selected_classes
 
             # Hide or show the item in the list
             label_item.setHidden(not should_show)
 
             # Update canvas visibility and checkbox state
-            if label_item in self.items_to_shapes:
-                shape = self.items_to_shapes[label_item]
-                if should_show:
-                    # Only show items that match the filter and are checked
-                    label_item.setCheckState(Qt.Checked)
-                    self.canvas.set_shape_visible(shape, True)
-                else:
-                    # Hide shapes that don't match the filter
-                    self.canvas.set_shape_visible(shape, False)
+            if should_show:
+                # Only show items that match the filter and are checked
+                label_item.setCheckState(checked)
+                self.canvas.set_shape_visible(shape, True)
+            else:
+                # Hide shapes that don't match the filter
+                self.canvas.set_shape_visible(shape, False)
+        self.label_list.blockSignals(False)
+        if reenable:
+            self.canvas.setUpdatesEnabled(True)
 
         self.canvas.update()
 
     def update_class_visibility_list(self, class_name):
         """Add a class to the visibility list if it doesn't exist."""
-        # Check if class already exists in list
-        for i in range(self.class_visibility_list.count()):
-            if self.class_visibility_list.item(i).data(Qt.UserRole) == class_name:
-                return  # Already exists
+        if class_name in self._visibility_items:
+            return  # Already exists
 
         # Add new class to list with checkbox
         new_item = QListWidgetItem(class_name)
@@ -972,6 +1188,7 @@ class MainWindow(QMainWindow, WindowMixin):
         new_item.setCheckState(Qt.Unchecked)  # Default unchecked for new classes
         new_item.setData(Qt.UserRole, class_name)
         self.class_visibility_list.addItem(new_item)
+        self._visibility_items[class_name] = new_item
 
     # React to canvas signals.
     def shape_selection_changed(self, selected=False):
@@ -984,14 +1201,16 @@ class MainWindow(QMainWindow, WindowMixin):
             # Update label list selection for all selected shapes
             self.label_list.clearSelection()
             for shape in self.canvas.selected_shapes:
-                if shape in self.shapes_to_items:
-                    self.shapes_to_items[shape].setSelected(True)
+                item = self._item_for_shape(shape)
+                if item is not None:
+                    item.setSelected(True)
 
             # Fallback to single selection
             shape = self.canvas.selected_shape
             if shape and shape not in self.canvas.selected_shapes:
-                if shape in self.shapes_to_items:
-                    self.shapes_to_items[shape].setSelected(True)
+                item = self._item_for_shape(shape)
+                if item is not None:
+                    item.setSelected(True)
 
             # Re-enable signals
             self.label_list.blockSignals(False)
@@ -1003,44 +1222,63 @@ class MainWindow(QMainWindow, WindowMixin):
         self.actions.shapeLineColor.setEnabled(selected)
         self.actions.shapeFillColor.setEnabled(selected)
 
-    def add_label(self, shape):
+    def _shape_for_item(self, item):
+        return self.items_to_shapes.get(item.data(SHAPE_ID_ROLE))
+
+    def _item_for_shape(self, shape):
+        return self._item_by_sid.get(self.items_to_shapes.rev.get(shape))
+
+    def add_label(self, shape, defer_update=False):
+        """Add a list item for `shape`.
+
+        With `defer_update` the per-item bookkeeping (action enabling,
+        visibility list, combo box) is skipped; bulk callers do it once
+        after their loop instead of once per shape.
+        """
         shape.paint_label = self.display_label_option.isChecked()
-        item = HashableQListWidgetItem(shape.label)
+        item = QListWidgetItem(shape.label)
         item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
         item.setCheckState(Qt.Checked)
         # Use custom color if set, otherwise generate color
-        item.setBackground(self.class_colors.get(shape.label, generate_color_by_text(shape.label)))
-        self.items_to_shapes[item] = shape
-        self.shapes_to_items[shape] = item
+        item.setBackground(self._brush_for(shape.label))
+        sid = self._next_shape_id
+        self._next_shape_id += 1
+        item.setData(SHAPE_ID_ROLE, sid)
+        self.items_to_shapes[sid] = shape
+        self._item_by_sid[sid] = item
         self.label_list.addItem(item)
+        if defer_update:
+            return
         for action in self.actions.onShapesPresent:
             action.setEnabled(True)
 
         # Update the NEW persistent class visibility list
         self.update_class_visibility_list(shape.label)
 
-        self.update_combo_box()
-
     def remove_label(self, shape):
         if shape is None:
             # print('rm empty label')
             return
-        item = self.shapes_to_items[shape]
+        sid = self.items_to_shapes.rev[shape]
+        item = self._item_by_sid.pop(sid)
         self.label_list.takeItem(self.label_list.row(item))
-        del self.shapes_to_items[shape]
-        del self.items_to_shapes[item]
-        self.update_combo_box()
+        self.items_to_shapes.pop(sid)
 
     def load_labels(self, shapes):
         s = []
+        # Suspend label list rendering and change signals while the items
+        # pour in; a single relayout happens when updates are re-enabled
+        # below, and the per-item bookkeeping runs once after the loop.
+        self.label_list.setUpdatesEnabled(False)
+        self.label_list.blockSignals(True)
+        any_snapped = False
         for label, points, line_color, fill_color, difficult in shapes:
             shape = Shape(label=label)
             for x, y in points:
 
                 # Ensure the labels are within the bounds of the image. If not, fix them.
                 x, y, snapped = self.canvas.snap_point_to_canvas(x, y)
-                if snapped:
-                    self.set_dirty()
+                any_snapped = any_snapped or snapped
 
                 shape.add_point(QPointF(x, y))
             shape.difficult = difficult
@@ -1051,31 +1289,45 @@ class MainWindow(QMainWindow, WindowMixin):
                 shape.line_color = QColor(*line_color)
             else:
                 # Use custom color if set, otherwise generate color
-                shape.line_color = self.class_colors.get(label, generate_color_by_text(label))
+                shape.line_color = self.color_for_class(label)
 
             if fill_color:
                 shape.fill_color = QColor(*fill_color)
             else:
                 # Use custom color if set, otherwise generate color
-                shape.fill_color = self.class_colors.get(label, generate_color_by_text(label))
+                shape.fill_color = self.color_for_class(label)
 
-            self.add_label(shape)
-        self.update_combo_box()
+            self.add_label(shape, defer_update=True)
+        self.label_list.blockSignals(False)
+        self.label_list.setUpdatesEnabled(True)
+        if any_snapped:
+            self.set_dirty()
+        if s:
+            for action in self.actions.onShapesPresent:
+                action.setEnabled(True)
+            # Insert any new classes as one batch without intermediate
+            # relayouts of the visibility list
+            self.class_visibility_list.setUpdatesEnabled(False)
+            try:
+                for label in set(shape.label for shape in s):
+                    self.update_class_visibility_list(label)
+            finally:
+                self.class_visibility_list.setUpdatesEnabled(True)
 
-        # Disable canvas updates to prevent flash before filter is applied
-        self.canvas.setUpdatesEnabled(False)
+        # Disable canvas updates to prevent flash before filter is applied;
+        # when a caller already suspended them, leave its suspension alone
+        reenable = self.canvas.updatesEnabled()
+        if reenable:
+            self.canvas.setUpdatesEnabled(False)
         self.canvas.load_shapes(s)
 
         # Re-apply the persistent class visibility filter to newly loaded labels
         self.class_visibility_changed()
 
         # Re-enable canvas updates and repaint once with filter applied
-        self.canvas.setUpdatesEnabled(True)
-        self.canvas.update()
-
-    def update_combo_box(self):
-        # Old combo_box removed - this method kept as no-op for compatibility
-        pass
+        if reenable:
+            self.canvas.setUpdatesEnabled(True)
+            self.canvas.update()
 
     def save_labels(self, annotation_file_path):
         annotation_file_path = ustr(annotation_file_path)
@@ -1092,20 +1344,26 @@ class MainWindow(QMainWindow, WindowMixin):
                         difficult=s.difficult)
 
         shapes = [format_shape(shape) for shape in self.canvas.shapes]
+        # The writers only need image dimensions; hand them the already
+        # decoded image rather than raw bytes so nothing is re-decoded or
+        # re-read from disk on save.
+        if not self.image.isNull():
+            self.image_data = self.image
         # Can add different annotation formats here
+        ext = os.path.splitext(annotation_file_path)[1].lower()
         try:
             if self.label_file_format == LabelFileFormat.PASCAL_VOC:
-                if annotation_file_path[-4:].lower() != ".xml":
+                if ext != XML_EXT:
                     annotation_file_path += XML_EXT
                 self.label_file.save_pascal_voc_format(annotation_file_path, shapes, self.file_path, self.image_data,
                                                        self.line_color.getRgb(), self.fill_color.getRgb())
             elif self.label_file_format == LabelFileFormat.YOLO:
-                if annotation_file_path[-4:].lower() != ".txt":
+                if ext != TXT_EXT:
                     annotation_file_path += TXT_EXT
                 self.label_file.save_yolo_format(annotation_file_path, shapes, self.file_path, self.image_data, self.label_hist,
                                                  self.line_color.getRgb(), self.fill_color.getRgb())
             elif self.label_file_format == LabelFileFormat.CREATE_ML:
-                if annotation_file_path[-5:].lower() != ".json":
+                if ext != JSON_EXT:
                     annotation_file_path += JSON_EXT
                 self.label_file.save_create_ml_format(annotation_file_path, shapes, self.file_path, self.image_data,
                                                       self.label_hist, self.line_color.getRgb(), self.fill_color.getRgb())
@@ -1113,6 +1371,14 @@ class MainWindow(QMainWindow, WindowMixin):
                 self.label_file.save(annotation_file_path, shapes, self.file_path, self.image_data,
                                      self.line_color.getRgb(), self.fill_color.getRgb())
             print('Image:{0} -> Annotation:{1}'.format(self.file_path, annotation_file_path))
+            # Keep the cached dir listing aware of the file we just wrote
+            listing = self._dir_listing_cache.get(os.path.dirname(annotation_file_path))
+            if listing is not None:
+                listing.add(os.path.basename(annotation_file_path))
+            # Drop any cached parse of the file we just rewrote
+            self._annotation_cache.pop(annotation_file_path, None)
+            self._annotation_cache.pop(
+                (annotation_file_path, os.path.basename(self.file_path)), None)
             return True
         except LabelFileError as e:
             self.error_message(u'Error saving label data', u'<b>%s</b>' % e)
@@ -1123,10 +1389,6 @@ class MainWindow(QMainWindow, WindowMixin):
         # fix copy and delete
         self.shape_selection_changed(True)
 
-    def combo_selection_changed(self, index):
-        # Old combo_box removed - this method kept as no-op for compatibility
-        pass
-
     def label_selection_changed(self):
         items = self.label_list.selectedItems()
         if items and self.canvas.editing():
@@ -1135,9 +1397,9 @@ class MainWindow(QMainWindow, WindowMixin):
                 # Support multiple selection
                 if len(items) == 1:
                     item = items[0]
-                    if item in self.items_to_shapes:
-                        self.canvas.select_shape(self.items_to_shapes[item])
-                        shape = self.items_to_shapes[item]
+                    shape = self._shape_for_item(item)
+                    if shape is not None:
+                        self.canvas.select_shape(shape)
                         # diffc_button removed - no longer needed
                 else:
                     # Multiple items selected - update selection without emitting signals
@@ -1146,8 +1408,8 @@ class MainWindow(QMainWindow, WindowMixin):
                     self.canvas.selected_shapes = []
 
                     for item in items:
-                        if item in self.items_to_shapes:
-                            shape = self.items_to_shapes[item]
+                        shape = self._shape_for_item(item)
+                        if shape is not None:
                             shape.selected = True
                             self.canvas.selected_shapes.append(shape)
 
@@ -1162,12 +1424,12 @@ class MainWindow(QMainWindow, WindowMixin):
                 self._no_selection_slot = False
 
     def label_item_changed(self, item):
-        shape = self.items_to_shapes[item]
+        shape = self._shape_for_item(item)
         label = item.text()
         if label != shape.label:
             shape.label = item.text()
             # Use custom color if set, otherwise generate color
-            shape.line_color = self.class_colors.get(shape.label, generate_color_by_text(shape.label))
+            shape.line_color = self.color_for_class(shape.label)
             self.set_dirty()
         else:  # User probably changed item visibility
             self.canvas.set_shape_visible(shape, item.checkState() == Qt.Checked)
@@ -1179,10 +1441,6 @@ class MainWindow(QMainWindow, WindowMixin):
         position MUST be in global coordinates.
         """
         if not self.use_default_label_checkbox.isChecked() or not self.default_label_combo.currentText():
-            if len(self.label_hist) > 0:
-                self.label_dialog = LabelDialog(
-                    parent=self, list_item=self.label_hist)
-
             # Sync single class mode from PR#106
             if self.single_class_mode.isChecked() and self.lastLabel:
                 text = self.lastLabel
@@ -1211,7 +1469,7 @@ class MainWindow(QMainWindow, WindowMixin):
 
             self.prev_label_text = text
             # Use custom color if set, otherwise generate color
-            generate_color = self.class_colors.get(text, generate_color_by_text(text))
+            generate_color = self.color_for_class(text)
             shape = self.canvas.set_last_label(text, generate_color, generate_color)
             self.add_label(shape)
             if self.beginner():  # Switch to edit mode.
@@ -1223,6 +1481,7 @@ class MainWindow(QMainWindow, WindowMixin):
 
             if text not in self.label_hist:
                 self.label_hist.append(text)
+                self.label_dialog.set_list_item(self.label_hist)
                 # Add to combo only if not already there
                 if self.default_label_combo.findText(text) == -1:
                     self.default_label_combo.addItem(text)
@@ -1309,38 +1568,38 @@ class MainWindow(QMainWindow, WindowMixin):
         self.adjust_scale()
 
     def toggle_polygons(self, value):
-        for item, shape in self.items_to_shapes.items():
-            item.setCheckState(Qt.Checked if value else Qt.Unchecked)
+        for sid in self.items_to_shapes:
+            self._item_by_sid[sid].setCheckState(Qt.Checked if value else Qt.Unchecked)
 
     def load_file(self, file_path=None):
         """Load the specified file, or the last opened file if None."""
-        # Save current zoom settings to restore them after loading
-        saved_zoom_mode = self.zoom_mode
-        saved_zoom_value = self.zoom_widget.value()
-        saved_h_scroll = self.scroll_bars[Qt.Horizontal].value()
-        saved_v_scroll = self.scroll_bars[Qt.Vertical].value()
+        # Save current zoom settings to restore them after loading; these
+        # live on the instance because loading now finishes asynchronously.
+        self._saved_zoom_mode = self.zoom_mode
+        self._saved_zoom_value = self.zoom_widget.value()
+        self._saved_h_scroll = self.scroll_bars[Qt.Horizontal].value()
+        self._saved_v_scroll = self.scroll_bars[Qt.Vertical].value()
 
         self.reset_state()
         self.canvas.setEnabled(False)
         if file_path is None:
             file_path = self.settings.get(SETTING_FILENAME)
 
-        # Make sure that filePath is a regular python string, rather than QString
-        file_path = ustr(file_path)
-
+        # Make sure that filePath is a regular python string, rather than
+        # QString, and normalize it once; every later use (list lookup,
+        # existence check, reader dispatch) shares this path.
         # Fix bug: An  index error after select a directory when open a new file.
-        unicode_file_path = ustr(file_path)
-        unicode_file_path = os.path.abspath(unicode_file_path)
+        unicode_file_path = os.path.abspath(ustr(file_path))
         # Tzutalin 20160906 : Add file list and dock to move faster
         # Highlight the file item
         if unicode_file_path and self.file_list_widget.count() > 0:
-            if unicode_file_path in self.m_img_list:
-                index = self.m_img_list.index(unicode_file_path)
+            if unicode_file_path in self._img_index:
+                index = self._img_index[unicode_file_path]
                 file_widget_item = self.file_list_widget.item(index)
                 file_widget_item.setSelected(True)
             else:
                 self.file_list_widget.clear()
-                self.m_img_list.clear()
+                self._set_img_list([])
 
         if unicode_file_path and os.path.exists(unicode_file_path):
             if LabelFile.is_label_file(unicode_file_path):
@@ -1357,25 +1616,46 @@ class MainWindow(QMainWindow, WindowMixin):
                 self.line_color = QColor(*self.label_file.lineColor)
                 self.fill_color = QColor(*self.label_file.fillColor)
                 self.canvas.verified = self.label_file.verified
-            else:
-                # Load image:
-                # read data first and store for saving into label file.
-                self.image_data = read(unicode_file_path, None)
-                self.label_file = None
-                self.canvas.verified = False
-
-            if isinstance(self.image_data, QImage):
-                image = self.image_data
-            else:
-                image = QImage.fromData(self.image_data)
-            if image.isNull():
-                self.error_message(u'Error opening file',
-                                   u"<p>Make sure <i>%s</i> is a valid image file." % unicode_file_path)
-                self.status("Error reading %s" % unicode_file_path)
-                return False
+                return self._finish_load_file(unicode_file_path)
+
+            # Standard image: read the bytes on a pool thread so navigation
+            # doesn't block the GUI on disk I/O; _image_loaded finishes up.
+            self.label_file = None
+            self.canvas.verified = False
+            self._load_seq += 1
+            self._pending_load_path = unicode_file_path
+            QThreadPool.globalInstance().start(
+                ImageLoadTask(self._load_seq, unicode_file_path,
+                              self._image_load_signals))
+            return True
+        return False
+
+    def _image_loaded(self, seq, file_path, image):
+        if seq != self._load_seq:
+            return  # a later navigation superseded this load
+        # _finish_load_file reports the error for null/unreadable images
+        self.image_data = image if image is not None else QImage()
+        self._finish_load_file(file_path)
+
+    def _finish_load_file(self, unicode_file_path):
+        if isinstance(self.image_data, QImage):
+            image = self.image_data
+        else:
+            image = QImage.fromData(self.image_data)
+        if image.isNull():
+            self.error_message(u'Error opening file',
+                               u"<p>Make sure <i>%s</i> is a valid image file." % unicode_file_path)
+            self.status("Error reading %s" % unicode_file_path)
+            self._pending_load_path = None
+            return False
+        # One repaint at the end covers pixmap load, shape load and zoom
+        # restoration instead of painting after each step.
+        self.canvas.setUpdatesEnabled(False)
+        try:
             # Don't show "Loaded" message - version label is always visible
             self.image = image
             self.file_path = unicode_file_path
+            self._pending_load_path = None
             self.canvas.load_pixmap(QPixmap.fromImage(image))
             if self.label_file:
                 self.load_labels(self.label_file.shapes)
@@ -1385,11 +1665,11 @@ class MainWindow(QMainWindow, WindowMixin):
             # Restore zoom mode and settings without reset
             # Block signals to prevent double painting during setup
             self.zoom_widget.blockSignals(True)
-            self.zoom_mode = saved_zoom_mode
+            self.zoom_mode = self._saved_zoom_mode
 
-            if saved_zoom_mode == self.MANUAL_ZOOM:
+            if self._saved_zoom_mode == self.MANUAL_ZOOM:
                 # For manual zoom, restore exact zoom value
-                self.zoom_widget.setValue(saved_zoom_value)
+                self.zoom_widget.setValue(self._saved_zoom_value)
             else:
                 # For fit window/fit width, recalculate scale for new image
                 value = self.scalers[self.zoom_mode]()
@@ -1400,20 +1680,19 @@ class MainWindow(QMainWindow, WindowMixin):
             self.paint_canvas()
 
             # Restore scroll positions for manual zoom
-            # Use both immediate and delayed restoration to handle timing issues
-            if saved_zoom_mode == self.MANUAL_ZOOM:
-                self.scroll_bars[Qt.Horizontal].setValue(saved_h_scroll)
-                self.scroll_bars[Qt.Vertical].setValue(saved_v_scroll)
-                # Also set with slight delay in case canvas isn't fully ready
-                QTimer.singleShot(100, lambda: self.scroll_bars[Qt.Horizontal].setValue(saved_h_scroll))
-                QTimer.singleShot(100, lambda: self.scroll_bars[Qt.Vertical].setValue(saved_v_scroll))
+            # Use both immediate and deferred restoration to handle timing issues
+            if self._saved_zoom_mode == self.MANUAL_ZOOM:
+                self._restore_scroll()
+                # Run once more after pending layout events, in case the
+                # canvas geometry wasn't final yet
+                QTimer.singleShot(0, self._restore_scroll)
 
             self.add_recent_file(self.file_path)
             self.toggle_actions(True)
-            self.show_bounding_box_from_annotation_file(file_path)
+            self.show_bounding_box_from_annotation_file(unicode_file_path)
 
             counter = self.counter_str()
-            self.setWindowTitle(__appname__ + ' ' + file_path + ' ' + counter)
+            self.setWindowTitle(__appname__ + ' ' + unicode_file_path + ' ' + counter)
 
             # Default : select last visible item if there is at least one visible item
             last_visible_item = self.get_last_visible_label_item()
@@ -1422,8 +1701,31 @@ class MainWindow(QMainWindow, WindowMixin):
                 last_visible_item.setSelected(True)
 
             self.canvas.setFocus(True)
-            return True
-        return False
+        finally:
+            self.canvas.setUpdatesEnabled(True)
+            self.canvas.update()
+        self._prefetch_next_image()
+        return True
+
+    def _restore_scroll(self):
+        self.scroll_bars[Qt.Horizontal].setValue(self._saved_h_scroll)
+        self.scroll_bars[Qt.Vertical].setValue(self._saved_v_scroll)
+
+    def _prefetch_next_image(self):
+        """Queue a read-ahead of the next image and its annotation file."""
+        next_idx = self.cur_img_idx + 1
+        if not self.m_img_list or next_idx >= self.img_count:
+            return
+        next_path = self.m_img_list[next_idx]
+        paths = [next_path]
+        stem = os.path.splitext(next_path)[0]
+        basename = os.path.basename(stem)
+        for ext in (XML_EXT, TXT_EXT, JSON_EXT):
+            if self.default_save_dir is not None:
+                paths.append(os.path.join(self.default_save_dir, basename + ext))
+            else:
+                paths.append(stem + ext)
+        QThreadPool.globalInstance().start(PrefetchTask(paths))
 
     def counter_str(self):
         """
@@ -1431,6 +1733,21 @@ class MainWindow(QMainWindow, WindowMixin):
         """
         return '[{} / {}]'.format(self.cur_img_idx + 1, self.img_count)
 
+    def _dir_listing(self, dir_path):
+        """Set of file names in `dir_path`, listed once and cached.
+
+        Saves three isfile probes per navigation against the save dir;
+        our own saves refresh the entry and save-dir changes drop it.
+        """
+        listing = self._dir_listing_cache.get(dir_path)
+        if listing is None:
+            try:
+                listing = set(os.listdir(dir_path))
+            except OSError:
+                listing = set()
+            self._dir_listing_cache[dir_path] = listing
+        return listing
+
     def show_bounding_box_from_annotation_file(self, file_path):
         if self.default_save_dir is not None:
             basename = os.path.basename(os.path.splitext(file_path)[0])
@@ -1441,11 +1758,12 @@ class MainWindow(QMainWindow, WindowMixin):
             """Annotation file priority:
             PascalXML > YOLO
             """
-            if os.path.isfile(xml_path):
+            listing = self._dir_listing(self.default_save_dir)
+            if basename + XML_EXT in listing:
                 self.load_pascal_xml_by_filename(xml_path)
-            elif os.path.isfile(txt_path):
+            elif basename + TXT_EXT in listing:
                 self.load_yolo_txt_by_filename(txt_path)
-            elif os.path.isfile(json_path):
+            elif basename + JSON_EXT in listing:
                 self.load_create_ml_json_by_filename(json_path, file_path)
 
         else:
@@ -1462,6 +1780,10 @@ class MainWindow(QMainWindow, WindowMixin):
             self.adjust_scale()
         super(MainWindow, self).resizeEvent(event)
 
+    def schedule_paint(self):
+        if not self.image.isNull():
+            self._repaint_timer.start()
+
     def paint_canvas(self):
         assert not self.image.isNull(), "cannot paint null image"
         self.canvas.scale = 0.01 * self.zoom_widget.value()
@@ -1505,7 +1827,7 @@ class MainWindow(QMainWindow, WindowMixin):
         settings[SETTING_WIN_STATE] = self.saveState()
         settings[SETTING_LINE_COLOR] = self.line_color
         settings[SETTING_FILL_COLOR] = self.fill_color
-        settings[SETTING_RECENT_FILES] = self.recent_files
+        settings[SETTING_RECENT_FILES] = '\n'.join(self.recent_files)
         settings[SETTING_ADVANCE_MODE] = not self._beginner
         if self.default_save_dir and os.path.exists(self.default_save_dir):
             settings[SETTING_SAVE_DIR] = ustr(self.default_save_dir)
@@ -1528,17 +1850,53 @@ class MainWindow(QMainWindow, WindowMixin):
         if self.may_continue():
             self.load_file(filename)
 
-    def scan_all_images(self, folder_path):
-        extensions = ['.%s' % fmt.data().decode("ascii").lower() for fmt in QImageReader.supportedImageFormats()]
+    def load_recent_index(self, index):
+        if index < len(self._recent_paths):
+            self.load_recent(self._recent_paths[index])
+
+    def scan_all_images(self, folder_path, recursive=False):
+        """List the images under `folder_path`, naturally sorted.
+
+        Only the folder itself is scanned by default; pass recursive=True
+        to descend into subdirectories as well.
+        """
+        root = os.path.abspath(folder_path)
+        # Key on the root's mtime: renames/additions directly under the
+        # root invalidate the entry. Nested-only changes can slip through
+        # until the bounded cache recycles, same trade-off as any
+        # mtime-keyed listing cache.
+        try:
+            cache_key = (root, os.stat(root).st_mtime_ns, recursive)
+        except OSError:
+            cache_key = None
+        if cache_key is not None:
+            cached = self._scan_cache.get(cache_key)
+            if cached is not None:
+                self._scan_cache.move_to_end(cache_key)
+                return list(cached)
+        extensions = self._img_ext_set
         images = []
 
-        for root, dirs, files in os.walk(folder_path):
-            for file in files:
-                if file.lower().endswith(tuple(extensions)):
-                    relative_path = os.path.join(root, file)
-                    path = ustr(os.path.abspath(relative_path))
-                    images.append(path)
+        def scan_dir(dir_path):
+            # DirEntry.is_dir/is_file reuse the type the OS returned with
+            # the directory listing, so no extra stat per entry is needed.
+            # entry.path is already absolute because the walk starts from
+            # an absolute root, so no per-file abspath call either.
+            with os.scandir(dir_path) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive:
+                            scan_dir(entry.path)
+                    elif entry.is_file(follow_symlinks=False) and \
+                            os.path.splitext(entry.name)[1].lower() in extensions:
+                        images.append(ustr(entry.path))
+
+        scan_dir(root)
         natural_sort(images, key=lambda x: x.lower())
+        if cache_key is not None:
+            self._scan_cache[cache_key] = list(images)
+            while len(self._scan_cache) > SCAN_CACHE_SIZE:
+                self._scan_cache.popitem(last=False)
         return images
 
     def change_save_dir_dialog(self, _value=False):
@@ -1553,6 +1911,7 @@ class MainWindow(QMainWindow, WindowMixin):
 
         if dir_path is not None and len(dir_path) > 1:
             self.default_save_dir = dir_path
+            self._dir_listing_cache.pop(dir_path, None)
 
         self.statusBar().showMessage('%s . Annotation will be saved to %s' %
                                      ('Change saved folder', self.default_save_dir))
@@ -1602,24 +1961,54 @@ class MainWindow(QMainWindow, WindowMixin):
         self.file_list_widget.clear()
 
         # Auto-detect classes file in the directory
-        possible_class_files = [
-            os.path.join(dir_path, "classes.txt"),
-            os.path.join(dir_path, "predefined_classes.txt")
-        ]
-        for class_file in possible_class_files:
-            if os.path.exists(class_file):
-                self.load_predefined_classes(class_file)
-                break
+        class_file = find_predefined_classes_file(dir_path)
+        if class_file:
+            self.load_predefined_classes(class_file)
 
         # Set default save directory to the opened directory
         self.default_save_dir = dir_path
-
-        self.m_img_list = self.scan_all_images(dir_path)
+        self._dir_listing_cache.pop(dir_path, None)
+
+        self._set_img_list([])
+
+        # Walk the directory off the GUI thread so large folders don't
+        # freeze the window; results arrive in batches via signals.
+        self._scan_thread = QThread(self)
+        self._scan_worker = DirScanWorker(dir_path, self.scan_all_images)
+        self._scan_worker.moveToThread(self._scan_thread)
+        self._scan_thread.started.connect(self._scan_worker.run)
+        self._scan_worker.batch_ready.connect(self.append_scanned_images)
+        self._scan_worker.finished.connect(self.dir_scan_finished)
+        self._scan_worker.finished.connect(self._scan_thread.quit)
+        self._scan_thread.finished.connect(self._scan_worker.deleteLater)
+        self._scan_thread.start()
+
+    def _set_img_list(self, images):
+        """Replace the image list, keeping count and path index in sync."""
+        self.m_img_list = list(images)
         self.img_count = len(self.m_img_list)
-        self.open_next_image()
-        for imgPath in self.m_img_list:
-            item = QListWidgetItem(imgPath)
-            self.file_list_widget.addItem(item)
+        self._img_index = {path: i for i, path in enumerate(self.m_img_list)}
+
+    def append_scanned_images(self, batch):
+        if self.sender() is not self._scan_worker:
+            return  # stale batch from a superseded scan
+        for path in batch:
+            self._img_index[path] = len(self.m_img_list)
+            self.m_img_list.append(path)
+        self.img_count = len(self.m_img_list)
+        # One relayout per batch instead of one per item
+        self.file_list_widget.setUpdatesEnabled(False)
+        self.file_list_widget.blockSignals(True)
+        self.file_list_widget.addItems(batch)
+        self.file_list_widget.blockSignals(False)
+        self.file_list_widget.setUpdatesEnabled(True)
+        self.status('Scanned %d images' % self.img_count)
+
+    def dir_scan_finished(self):
+        if self.sender() is not self._scan_worker:
+            return
+        if self.m_img_list and self.file_path is None:
+            self.open_next_image()
 
     def verify_image(self, _value=False):
         # Proceeding next image without dialog if having any label
@@ -1644,23 +2033,33 @@ class MainWindow(QMainWindow, WindowMixin):
         # To be implemented later
         pass
 
-    def open_prev_image(self, _value=False):
-        # Proceeding prev image without dialog if having any label
+    def _pre_navigate(self):
+        """Shared pre-flight for prev/next/go-to navigation.
+
+        Auto-saves a dirty image when enabled and confirms unsaved
+        changes; returns False when navigation should be abandoned.
+        """
+        if self.img_count <= 0:
+            return False
+
         if self.auto_saving.isChecked():
             if self.default_save_dir is not None:
                 if self.dirty is True:
                     self.save_file()
             else:
                 self.change_save_dir_dialog()
-                return
+                return False
 
-        if not self.may_continue():
-            return
+        return self.may_continue()
 
-        if self.img_count <= 0:
+    def open_prev_image(self, _value=False):
+        # Proceeding prev image without dialog if having any label
+        if not self._pre_navigate():
             return
 
-        if self.file_path is None:
+        # A load still in flight counts as a current position; only bail
+        # when nothing is open or loading at all
+        if self.file_path is None and self._pending_load_path is None:
             return
 
         if self.cur_img_idx - 1 >= 0:
@@ -1671,25 +2070,16 @@ class MainWindow(QMainWindow, WindowMixin):
 
     def open_next_image(self, _value=False):
         # Proceeding prev image without dialog if having any label
-        if self.auto_saving.isChecked():
-            if self.default_save_dir is not None:
-                if self.dirty is True:
-                    self.save_file()
-            else:
-                self.change_save_dir_dialog()
-                return
-
-        if not self.may_continue():
-            return
-
-        if self.img_count <= 0:
+        if not self._pre_navigate():
             return
 
         filename = None
-        if self.file_path is None:
+        if self.file_path is None and self._pending_load_path is None:
             filename = self.m_img_list[0]
             self.cur_img_idx = 0
         else:
+            # Advance from cur_img_idx, not from file_path: with loads
+            # finishing asynchronously, file_path lags behind the index
             if self.cur_img_idx + 1 < self.img_count:
                 self.cur_img_idx += 1
                 filename = self.m_img_list[self.cur_img_idx]
@@ -1723,16 +2113,7 @@ class MainWindow(QMainWindow, WindowMixin):
         # Convert to 0-indexed
         target_idx = image_num - 1
 
-        # Auto-save if enabled
-        if self.auto_saving.isChecked():
-            if self.default_save_dir is not None:
-                if self.dirty is True:
-                    self.save_file()
-            else:
-                self.change_save_dir_dialog()
-                return
-
-        if not self.may_continue():
+        if not self._pre_navigate():
             return
 
         # Navigate to the image
@@ -1747,8 +2128,7 @@ class MainWindow(QMainWindow, WindowMixin):
         if not self.may_continue():
             return
         path = os.path.dirname(ustr(self.file_path)) if self.file_path else '.'
-        formats = ['*.%s' % fmt.data().decode("ascii").lower() for fmt in QImageReader.supportedImageFormats()]
-        filters = "Image & Label files (%s)" % ' '.join(formats + ['*%s' % LabelFile.suffix])
+        filters = "Image & Label files (%s *%s)" % (self._img_format_globs, LabelFile.suffix)
         filename = QFileDialog.getOpenFileName(self, '%s - Choose Image or Label file' % __appname__, path, filters)
         if filename:
             if isinstance(filename, (tuple, list)):
@@ -1811,13 +2191,28 @@ class MainWindow(QMainWindow, WindowMixin):
 
     def delete_image(self):
         delete_path = self.file_path
-        if delete_path is not None:
-            self.open_next_image()
-            self.cur_img_idx -= 1
-            self.img_count -= 1
-            if os.path.exists(delete_path):
-                os.remove(delete_path)
-            self.import_dir_images(self.last_open_dir)
+        if delete_path is None:
+            return
+        idx = self._img_index.get(delete_path)
+        try:
+            os.remove(delete_path)
+        except FileNotFoundError:
+            pass
+        if idx is None:
+            # Standalone image, no directory list to maintain
+            self.close_file()
+            return
+        # Splice the entry out of the in-memory list and file widget
+        # instead of rescanning the whole directory from disk.
+        del self.m_img_list[idx]
+        self.img_count = len(self.m_img_list)
+        self._img_index = {path: i for i, path in enumerate(self.m_img_list)}
+        self.file_list_widget.takeItem(idx)
+        if not self.m_img_list:
+            self.close_file()
+            return
+        self.cur_img_idx = min(idx, self.img_count - 1)
+        self.load_file(self.m_img_list[self.cur_img_idx])
 
     def reset_all(self):
         self.settings.reset()
@@ -1869,6 +2264,7 @@ class MainWindow(QMainWindow, WindowMixin):
                 if shape in self.canvas.shapes:
                     self.canvas.shapes.remove(shape)
                     self.remove_label(shape)
+            self.canvas.invalidate_shape_keys()
             self.canvas.de_select_shape()
         else:
             # Fallback to single deletion
@@ -1878,8 +2274,8 @@ class MainWindow(QMainWindow, WindowMixin):
 
         # After deletion, select the last visible box if any visible boxes remain
         last_visible_item = self.get_last_visible_label_item()
-        if last_visible_item and last_visible_item in self.items_to_shapes:
-            last_shape = self.items_to_shapes[last_visible_item]
+        last_shape = self._shape_for_item(last_visible_item) if last_visible_item else None
+        if last_shape is not None:
             self.canvas.select_shape(last_shape)
         elif self.no_shapes():
             for action in self.actions.onShapesPresent:
@@ -1938,11 +2334,7 @@ class MainWindow(QMainWindow, WindowMixin):
             row_layout.addWidget(class_label)
 
             # Get current color for this class
-            if class_name in self.class_colors:
-                current_color = self.class_colors[class_name]
-            else:
-                # Use the generated color
-                current_color = generate_color_by_text(class_name)
+            current_color = self.color_for_class(class_name)
 
             # Color preview button
             color_button = QPushButton()
@@ -1952,10 +2344,11 @@ class MainWindow(QMainWindow, WindowMixin):
             # Connect button to color picker
             def make_color_picker(cls_name, btn):
                 def pick_color():
-                    current = self.class_colors.get(cls_name, generate_color_by_text(cls_name))
+                    current = self.color_for_class(cls_name)
                     color = QColorDialog.getColor(current, dialog, f'Choose color for {cls_name}')
                     if color.isValid():
                         self.class_colors[cls_name] = color
+                        self._label_brush_cache.pop(cls_name, None)
                         btn.setStyleSheet(f'background-color: {color.name()}; border: 1px solid #999;')
                         # Update canvas to reflect new colors
                         self.canvas.update()
@@ -1992,6 +2385,7 @@ class MainWindow(QMainWindow, WindowMixin):
     def reset_all_colors(self, dialog):
         """Reset all class colors to default."""
         self.class_colors = {}
+        self._label_brush_cache.clear()
         self.canvas.update()
         self.set_dirty()
         dialog.accept()
@@ -2009,36 +2403,82 @@ class MainWindow(QMainWindow, WindowMixin):
 
     def load_predefined_classes(self, predef_classes_file):
         if os.path.exists(predef_classes_file) is True:
-            with codecs.open(predef_classes_file, 'r', 'utf8') as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:  # Skip empty lines
-                        continue
-                    # Only add if not already in label_hist (prevent duplicates)
-                    if self.label_hist is None:
-                        self.label_hist = [line]
-                    elif line not in self.label_hist:
-                        self.label_hist.append(line)
-                    # Add to default label dropdown if it exists and not already there
-                    if hasattr(self, 'default_label_combo'):
-                        # Check if item already exists in combobox
-                        if self.default_label_combo.findText(line) == -1:
-                            self.default_label_combo.addItem(line)
-                    # Add to class visibility list if it exists and not already there
-                    if hasattr(self, 'class_visibility_list'):
-                        # Check if class already exists in visibility list
-                        class_exists = False
-                        for i in range(self.class_visibility_list.count()):
-                            if self.class_visibility_list.item(i).data(Qt.UserRole) == line:
-                                class_exists = True
-                                break
-                        if not class_exists:
-                            # Add new class to visibility list with checkbox
-                            new_item = QListWidgetItem(line)
-                            new_item.setFlags(new_item.flags() | Qt.ItemIsUserCheckable)
-                            new_item.setCheckState(Qt.Unchecked)  # Default unchecked
-                            new_item.setData(Qt.UserRole, line)
-                            self.class_visibility_list.addItem(new_item)
+            # Mass-inserting checkable rows must not fire one
+            # class_visibility_changed per item; silence the list while
+            # the batch goes in and repaint once afterwards.
+            has_visibility_list = hasattr(self, 'class_visibility_list')
+            if has_visibility_list:
+                self.class_visibility_list.blockSignals(True)
+                self.class_visibility_list.setUpdatesEnabled(False)
+            try:
+                self._load_predefined_classes(predef_classes_file)
+            finally:
+                if has_visibility_list:
+                    self.class_visibility_list.setUpdatesEnabled(True)
+                    self.class_visibility_list.blockSignals(False)
+            if hasattr(self, 'label_dialog'):
+                self.label_dialog.set_list_item(self.label_hist)
+
+    def _load_predefined_classes(self, predef_classes_file):
+        if self.label_hist is None:
+            self.label_hist = []
+        # Set-based membership instead of scanning label_hist / the combo
+        # box once per line; combo rows are appended in one batch.
+        existing_classes = set(self.label_hist)
+        has_combo = hasattr(self, 'default_label_combo')
+        has_visibility_list = hasattr(self, 'class_visibility_list')
+        if has_combo:
+            combo_classes = set(self.default_label_combo.itemText(i)
+                                for i in range(self.default_label_combo.count()))
+        new_combo_items = []
+        # Built-in open decodes utf-8 natively and reads in large
+        # buffered chunks; codecs.open wraps a StreamReader per line.
+        with open(predef_classes_file, 'r', encoding='utf-8',
+                  buffering=1 << 16) as f:
+            for line in f:
+                line = line.strip()
+                if not line:  # Skip empty lines
+                    continue
+                # Only add if not already in label_hist (prevent duplicates)
+                if line not in existing_classes:
+                    existing_classes.add(line)
+                    self.label_hist.append(line)
+                # Add to default label dropdown if it exists and not already there
+                if has_combo and line not in combo_classes:
+                    combo_classes.add(line)
+                    new_combo_items.append(line)
+                # Add to class visibility list if it exists and not already there
+                if has_visibility_list:
+                    self.update_class_visibility_list(line)
+        if new_combo_items:
+            self.default_label_combo.addItems(new_combo_items)
+
+    def load_annotation_by_path(self, path, parse, key=None):
+        """Return the cached parse result for an annotation file.
+
+        The cache entry is validated against the file's mtime and size, so
+        edits on disk (including our own saves) invalidate stale entries
+        automatically. `key` defaults to the path; readers whose output
+        depends on more than the file (e.g. CreateML) pass an extended key.
+        """
+        if key is None:
+            key = path
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return parse()
+        entry = self._annotation_cache.get(key)
+        if entry is not None and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+            self._annotation_cache.move_to_end(key)
+            # Hand out shallow copies of the contained lists so callers
+            # can't mutate what later hits would see.
+            return tuple(list(v) if isinstance(v, list) else v
+                         for v in entry[2])
+        result = parse()
+        self._annotation_cache[key] = (stat.st_mtime_ns, stat.st_size, result)
+        if len(self._annotation_cache) > ANNOTATION_CACHE_SIZE:
+            self._annotation_cache.popitem(last=False)
+        return result
 
     def load_pascal_xml_by_filename(self, xml_path):
         if self.file_path is None:
@@ -2048,10 +2488,13 @@ class MainWindow(QMainWindow, WindowMixin):
 
         self.set_format(FORMAT_PASCALVOC)
 
-        t_voc_parse_reader = PascalVocReader(xml_path)
-        shapes = t_voc_parse_reader.get_shapes()
+        def parse():
+            t_voc_parse_reader = PascalVocReader(xml_path)
+            return t_voc_parse_reader.get_shapes(), t_voc_parse_reader.verified
+
+        shapes, verified = self.load_annotation_by_path(xml_path, parse)
         self.load_labels(shapes)
-        self.canvas.verified = t_voc_parse_reader.verified
+        self.canvas.verified = verified
 
     def load_yolo_txt_by_filename(self, txt_path):
         if self.file_path is None:
@@ -2060,19 +2503,23 @@ class MainWindow(QMainWindow, WindowMixin):
             return
 
         self.set_format(FORMAT_YOLO)
-        t_yolo_parse_reader = YoloReader(txt_path, self.image)
-        shapes = t_yolo_parse_reader.get_shapes()
 
-        print(shapes)
+        def parse():
+            t_yolo_parse_reader = YoloReader(txt_path, self.image)
+            return (t_yolo_parse_reader.get_shapes(), t_yolo_parse_reader.verified,
+                    t_yolo_parse_reader.invalid_classes, len(t_yolo_parse_reader.classes))
+
+        shapes, verified, invalid_classes, total_classes = \
+            self.load_annotation_by_path(txt_path, parse)
+
         self.load_labels(shapes)
-        self.canvas.verified = t_yolo_parse_reader.verified
+        self.canvas.verified = verified
 
         # Check for invalid classes and auto-clean the file
-        if t_yolo_parse_reader.invalid_classes:
-            total_classes = len(t_yolo_parse_reader.classes)
+        if invalid_classes:
             invalid_info = []
             total_invalid = 0
-            for class_idx, count in t_yolo_parse_reader.invalid_classes.items():
+            for class_idx, count in invalid_classes.items():
                 invalid_info.append(f"{count} object(s) with class index {class_idx}")
                 total_invalid += count
 
@@ -2096,13 +2543,21 @@ class MainWindow(QMainWindow, WindowMixin):
 
         self.set_format(FORMAT_CREATEML)
 
-        create_ml_parse_reader = CreateMLReader(json_path, file_path)
-        shapes = create_ml_parse_reader.get_shapes()
+        def parse():
+            create_ml_parse_reader = CreateMLReader(json_path, file_path)
+            return create_ml_parse_reader.get_shapes(), create_ml_parse_reader.verified
+
+        # The reader only extracts the entry matching this image, so the
+        # image file name is part of the cache key.
+        shapes, verified = self.load_annotation_by_path(
+            json_path, parse, key=(json_path, os.path.basename(file_path)))
         self.load_labels(shapes)
-        self.canvas.verified = create_ml_parse_reader.verified
+        self.canvas.verified = verified
 
     def copy_previous_bounding_boxes(self):
-        current_index = self.m_img_list.index(self.file_path)
+        current_index = self._img_index.get(self.file_path)
+        if current_index is None:
+            return
         if current_index - 1 >= 0:
             prev_file_path = self.m_img_list[current_index - 1]
             self.show_bounding_box_from_annotation_file(prev_file_path)
@@ -2114,42 +2569,105 @@ class MainWindow(QMainWindow, WindowMixin):
         # Enable copy action when shapes are selected
         self.actions.copySelection.setEnabled(True)
 
+    def _shapes_to_clipboard(self, shapes, source_image):
+        """Serialize `shapes` onto the system clipboard as a MIME payload."""
+        data = QByteArray()
+        stream = QDataStream(data, QIODevice.WriteOnly)
+        stream.writeQString(source_image if source_image else '')
+        stream.writeInt32(len(shapes))
+        for shape in shapes:
+            stream.writeQString(shape.label if shape.label else '')
+            stream.writeBool(bool(shape.difficult))
+            stream.writeInt32(len(shape.points))
+            for p in shape.points:
+                stream.writeDouble(p.x())
+                stream.writeDouble(p.y())
+            stream.writeUInt32(shape.line_color.rgba())
+            stream.writeUInt32(shape.fill_color.rgba())
+        mime = QMimeData()
+        mime.setData(SHAPES_MIME_TYPE, data)
+        QApplication.clipboard().setMimeData(mime)
+
+    def _shapes_from_clipboard(self):
+        """Decode shapes from the system clipboard.
+
+        Returns (shapes, source_image); shapes is an empty list when the
+        clipboard holds no shape payload.
+        """
+        mime = QApplication.clipboard().mimeData()
+        if mime is None or not mime.hasFormat(SHAPES_MIME_TYPE):
+            return [], None
+        stream = QDataStream(mime.data(SHAPES_MIME_TYPE), QIODevice.ReadOnly)
+        source_image = stream.readQString() or None
+        shapes = []
+        for _ in range(stream.readInt32()):
+            shape = Shape(label=stream.readQString())
+            shape.difficult = stream.readBool()
+            for _ in range(stream.readInt32()):
+                x = stream.readDouble()
+                y = stream.readDouble()
+                shape.add_point(QPointF(x, y))
+            shape.line_color = QColor.fromRgba(stream.readUInt32())
+            shape.fill_color = QColor.fromRgba(stream.readUInt32())
+            shape.close()
+            shapes.append(shape)
+        return shapes, source_image
+
     def copy_selected_boxes(self):
         """Copy selected boxes to clipboard."""
-        self.clipboard = self.canvas.copy_selected_shapes()
-        if self.clipboard:
-            # Track which image these boxes were copied from
-            self.clipboard_source_image = self.file_path
-            self.statusBar().showMessage(f'Copied {len(self.clipboard)} box(es) to clipboard')
+        shapes = self.canvas.copy_selected_shapes()
+        if shapes:
+            # The payload lives on the system clipboard, so boxes survive
+            # across instances and can be pasted between processes
+            self._shapes_to_clipboard(shapes, self.file_path)
+            self.statusBar().showMessage(f'Copied {len(shapes)} box(es) to clipboard')
             self.statusBar().show()
             # Enable paste action
             self.actions.pasteSelection.setEnabled(True)
 
     def paste_selected_boxes(self):
         """Paste boxes from clipboard."""
-        if not self.clipboard:
+        clipboard_shapes, clipboard_source_image = self._shapes_from_clipboard()
+        if not clipboard_shapes:
             self.statusBar().showMessage('Clipboard is empty')
             self.statusBar().show()
             return
 
         # Check if pasting to the same image or different image
-        is_same_image = (self.clipboard_source_image == self.file_path)
+        is_same_image = (clipboard_source_image == self.file_path)
 
-        clipboard_count = len(self.clipboard)
+        clipboard_count = len(clipboard_shapes)
         # Only apply offset when pasting to same image
         # Only check for duplicates when pasting to a different image
         pasted_shapes = self.canvas.paste_shapes(
-            self.clipboard,
+            clipboard_shapes,
             check_duplicates=not is_same_image,
             apply_offset=is_same_image
         )
 
-        for shape in pasted_shapes:
-            self.add_label(shape)
+        # Batch the list inserts the same way load_labels does: one
+        # relayout when updates resume, bookkeeping once after the loop.
+        self.label_list.setUpdatesEnabled(False)
+        self.label_list.blockSignals(True)
+        try:
+            for shape in pasted_shapes:
+                self.add_label(shape, defer_update=True)
+        finally:
+            self.label_list.blockSignals(False)
+            self.label_list.setUpdatesEnabled(True)
+        if pasted_shapes:
+            for action in self.actions.onShapesPresent:
+                action.setEnabled(True)
+            self.class_visibility_list.setUpdatesEnabled(False)
+            try:
+                for label in set(shape.label for shape in pasted_shapes):
+                    self.update_class_visibility_list(label)
+            finally:
+                self.class_visibility_list.setUpdatesEnabled(True)
 
         # Update clipboard with newly pasted positions for repeated same-image pastes
         if is_same_image and pasted_shapes:
-            self.clipboard = pasted_shapes
+            self._shapes_to_clipboard(pasted_shapes, self.file_path)
 
         skipped_count = clipboard_count - len(pasted_shapes)
         self.set_dirty()
@@ -2167,50 +2685,92 @@ class MainWindow(QMainWindow, WindowMixin):
     def toggle_draw_square(self):
         self.canvas.set_drawing_shape_to_square(self.draw_squares_option.isChecked())
 
+# inverted() runs per shape outline on every repaint while the palette is
+# a handful of stable colors; memoize per packed-rgba value.
+_INVERTED_CACHE = {}
+
+
 def inverted(color):
-    return QColor(*[255 - v for v in color.getRgb()])
+    key = color.rgba()
+    cached = _INVERTED_CACHE.get(key)
+    if cached is None:
+        # Flip the RGB bits of the packed value in one operation, alpha
+        # preserved — same result as 255 - v per channel.
+        cached = _INVERTED_CACHE[key] = QColor.fromRgba(
+            (key & 0xFF000000) | (~key & 0x00FFFFFF))
+    return cached
+
+
+# Small mtime-keyed cache of decoded images, so stepping back and forth
+# between neighbouring files doesn't re-decode them every time.
+_read_cache = OrderedDict()
+_READ_CACHE_SIZE = 8
 
 
 def read(filename, default=None):
     try:
+        key = (filename, os.path.getmtime(filename))
+        cached = _read_cache.get(key)
+        if cached is not None:
+            _read_cache.move_to_end(key)
+            return cached
         reader = QImageReader(filename)
         reader.setAutoTransform(True)
-        return reader.read()
+        image = reader.read()
+        if not image.isNull():
+            _read_cache[key] = image
+            while len(_read_cache) > _READ_CACHE_SIZE:
+                _read_cache.popitem(last=False)
+        return image
     except:
         return default
 
 
+def find_predefined_classes_file(dir_path):
+    """Locate classes.txt (preferred) or predefined_classes.txt in
+    `dir_path` with a single directory read, or return None."""
+    wanted = {'classes.txt', 'predefined_classes.txt'}
+    found = {}
+    try:
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                if entry.name in wanted and entry.is_file():
+                    found[entry.name] = entry.path
+    except OSError:
+        return None
+    return found.get('classes.txt') or found.get('predefined_classes.txt')
+
+
+USAGE = """usage: labelImg.py [-h] [image_dir] [class_file] [save_dir]"""
+
+
 def get_main_app(argv=[]):
     """
     Standard boilerplate Qt application code.
     Do everything but app.exec_() -- so that we can test the application in one thread
     """
-    app = QApplication(argv)
+    # Launch arguments are parsed below; hand Qt just the program name so
+    # it doesn't rescan the list for Qt flags this app never takes.
+    app = QApplication(argv[:1])
     app.setApplicationName(__appname__)
-    app.setWindowIcon(new_icon("app"))
-    # Tzutalin 201705+: Accept extra agruments to change predefined class file
-    argparser = argparse.ArgumentParser()
-    argparser.add_argument("image_dir", nargs="?")
+    # Tzutalin 201705+: Accept extra agruments to change predefined class file.
+    # Three optional positionals don't warrant argparse; slice argv directly
+    # and skip the parser construction on every launch.
+    if '-h' in argv or '--help' in argv:
+        print(USAGE)
+        sys.exit(0)
     default_class_file = os.path.join(os.path.dirname(__file__), "data", "predefined_classes.txt")
-    argparser.add_argument("class_file",
-                           default=default_class_file,
-                           nargs="?")
-    argparser.add_argument("save_dir", nargs="?")
-    args = argparser.parse_args(argv[1:])
+    args = Struct(image_dir=argv[1] if len(argv) > 1 else None,
+                  class_file=argv[2] if len(argv) > 2 else default_class_file,
+                  save_dir=argv[3] if len(argv) > 3 else None)
 
     args.image_dir = args.image_dir and os.path.normpath(args.image_dir)
 
     # If classes file is the default and image_dir is provided, look for classes in image_dir
     if args.image_dir and args.class_file == default_class_file:
-        # Try common class file names in image_dir
-        possible_class_files = [
-            os.path.join(args.image_dir, "classes.txt"),
-            os.path.join(args.image_dir, "predefined_classes.txt")
-        ]
-        for class_file in possible_class_files:
-            if os.path.exists(class_file):
-                args.class_file = class_file
-                break
+        class_file = find_predefined_classes_file(args.image_dir)
+        if class_file:
+            args.class_file = class_file
 
     args.class_file = args.class_file and os.path.normpath(args.class_file)
     args.save_dir = args.save_dir and os.path.normpath(args.save_dir)
@@ -2224,6 +2784,9 @@ def get_main_app(argv=[]):
                      args.class_file,
                      args.save_dir)
     win.show()
+    # Decode the application icon on the first event-loop tick, after the
+    # window has painted; it isn't needed for time-to-first-frame.
+    QTimer.singleShot(0, lambda: app.setWindowIcon(new_icon("app")))
     return app, win
 
 
@@ -38,6 +38,10 @@ class Canvas(QWidget):
         # Initialise local state.
         self.mode = self.EDIT
         self.shapes = []
+        # Rounded-coordinate keys of self.shapes, rebuilt lazily by
+        # paste_shapes; any mutation of the shape list or of shape
+        # geometry drops it via invalidate_shape_keys().
+        self._shape_keys = None
         self.current = None
         self.selected_shape = None  # save the selected shape here
         self.selected_shapes = []  # support multiple selection
@@ -68,6 +72,10 @@ class Canvas(QWidget):
         # initialisation for panning
         self.pan_initial_pos = QPoint()
 
+    def invalidate_shape_keys(self):
+        """Drop the cached duplicate-detection keys; shapes changed."""
+        self._shape_keys = None
+
     def set_drawing_color(self, qcolor):
         self.drawing_line_color = qcolor
         self.drawing_rect_color = qcolor
@@ -362,6 +370,7 @@ class Canvas(QWidget):
 
     def end_move(self, copy=False):
         assert self.selected_shape and self.selected_shape_copy
+        self.invalidate_shape_keys()
         shape = self.selected_shape_copy
         # del shape.fill_color
         # del shape.line_color
@@ -555,6 +564,7 @@ class Canvas(QWidget):
             right_shift = QPointF(0, shift_pos.y())
         shape.move_vertex_by(right_index, right_shift)
         shape.move_vertex_by(left_index, left_shift)
+        self.invalidate_shape_keys()
 
     def bounded_move_shape(self, shape, pos):
         if self.out_of_pixmap(pos):
@@ -574,6 +584,7 @@ class Canvas(QWidget):
         dp = pos - self.prev_point
         if dp:
             shape.move_by(dp)
+            self.invalidate_shape_keys()
             self.prev_point = pos
             return True
         return False
@@ -593,6 +604,7 @@ class Canvas(QWidget):
         if self.selected_shape:
             shape = self.selected_shape
             self.shapes.remove(self.selected_shape)
+            self.invalidate_shape_keys()
             self.selected_shape = None
             self.update()
             return shape
@@ -602,6 +614,7 @@ class Canvas(QWidget):
             shape = self.selected_shape.copy()
             self.de_select_shape()
             self.shapes.append(shape)
+            self.invalidate_shape_keys()
             shape.selected = True
             self.selected_shape = shape
             self.bounded_shift_shape(shape)
@@ -627,7 +640,16 @@ class Canvas(QWidget):
             return []
 
         pasted_shapes = []
-        skipped_count = 0
+
+        # One pass over the existing shapes builds a key set, so each
+        # candidate is a set lookup instead of a scan of every shape.
+        # The key set survives between pastes; rebuild it only when a
+        # mutation has invalidated it, then keep it current incrementally.
+        existing_keys = None
+        if check_duplicates:
+            if self._shape_keys is None:
+                self._shape_keys = {self._shape_key(shape) for shape in self.shapes}
+            existing_keys = self._shape_keys
 
         for shape_data in shapes_to_paste:
             # Create a copy of the shape
@@ -638,18 +660,19 @@ class Canvas(QWidget):
                 self.bounded_shift_shape(new_shape)
 
             # Check if a shape with same coordinates already exists (only if check_duplicates is True)
-            is_duplicate = False
             if check_duplicates:
-                for existing_shape in self.shapes:
-                    if self._shapes_have_same_coords(new_shape, existing_shape):
-                        is_duplicate = True
-                        skipped_count += 1
-                        break
-
-            # Only paste if not a duplicate (or if we're not checking for duplicates)
-            if not is_duplicate:
-                self.shapes.append(new_shape)
-                pasted_shapes.append(new_shape)
+                key = self._shape_key(new_shape)
+                if key in existing_keys:
+                    continue
+                existing_keys.add(key)
+            elif self._shape_keys is not None:
+                # Keep an already-built set in sync even when this paste
+                # doesn't consult it, so a later duplicate check isn't
+                # working from stale keys
+                self._shape_keys.add(self._shape_key(new_shape))
+
+            self.shapes.append(new_shape)
+            pasted_shapes.append(new_shape)
 
         # Select the newly pasted shapes
         if pasted_shapes:
@@ -663,16 +686,10 @@ class Canvas(QWidget):
         self.update()
         return pasted_shapes
 
-    def _shapes_have_same_coords(self, shape1, shape2, tolerance=3.0):
-        """Check if two shapes have the same coordinates within tolerance."""
-        if len(shape1.points) != len(shape2.points):
-            return False
-
-        for p1, p2 in zip(shape1.points, shape2.points):
-            if abs(p1.x() - p2.x()) > tolerance or abs(p1.y() - p2.y()) > tolerance:
-                return False
-
-        return True
+    @staticmethod
+    def _shape_key(shape):
+        """Hashable pixel-resolution coordinate key for duplicate checks."""
+        return tuple((round(p.x()), round(p.y())) for p in shape.points)
 
     def bounded_shift_shape(self, shape):
         # Try to move in one direction, and if it fails in another.
@@ -779,6 +796,7 @@ class Canvas(QWidget):
 
         self.current.close()
         self.shapes.append(self.current)
+        self.invalidate_shape_keys()
         self.current = None
         self.set_hiding(False)
         self.newShape.emit()
@@ -872,6 +890,7 @@ class Canvas(QWidget):
             self.selected_shape.points[1] += QPointF(0, 1.0)
             self.selected_shape.points[2] += QPointF(0, 1.0)
             self.selected_shape.points[3] += QPointF(0, 1.0)
+        self.invalidate_shape_keys()
         self.shapeMoved.emit()
         self.repaint()
 
@@ -893,6 +912,7 @@ class Canvas(QWidget):
     def undo_last_line(self):
         assert self.shapes
         self.current = self.shapes.pop()
+        self.invalidate_shape_keys()
         self.current.set_open()
         self.line.points = [self.current[-1], self.current[0]]
         self.drawingPolygon.emit(True)
@@ -900,6 +920,7 @@ class Canvas(QWidget):
     def reset_all_lines(self):
         assert self.shapes
         self.current = self.shapes.pop()
+        self.invalidate_shape_keys()
         self.current.set_open()
         self.line.points = [self.current[-1], self.current[0]]
         self.drawingPolygon.emit(True)
@@ -910,10 +931,12 @@ class Canvas(QWidget):
     def load_pixmap(self, pixmap):
         self.pixmap = pixmap
         self.shapes = []
+        self.invalidate_shape_keys()
         # Don't repaint here - let the caller handle painting with correct zoom
 
     def load_shapes(self, shapes):
         self.shapes = list(shapes)
+        self.invalidate_shape_keys()
         self.current = None
         self.repaint()
 
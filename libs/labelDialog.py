@@ -21,10 +21,9 @@ class LabelDialog(QDialog):
         self.edit.setValidator(label_validator())
         self.edit.editingFinished.connect(self.post_process)
 
-        model = QStringListModel()
-        model.setStringList(list_item)
+        self._completer_model = QStringListModel()
         completer = QCompleter()
-        completer.setModel(model)
+        completer.setModel(self._completer_model)
         self.edit.setCompleter(completer)
 
         layout = QVBoxLayout()
@@ -36,15 +35,25 @@ class LabelDialog(QDialog):
         bb.rejected.connect(self.reject)
         layout.addWidget(bb)
 
-        if list_item is not None and len(list_item) > 0:
-            self.list_widget = QListWidget(self)
-            for item in list_item:
-                self.list_widget.addItem(item)
-            self.list_widget.itemClicked.connect(self.list_item_click)
-            self.list_widget.itemDoubleClicked.connect(self.list_item_double_click)
-            layout.addWidget(self.list_widget)
+        self.list_widget = QListWidget(self)
+        self.list_widget.itemClicked.connect(self.list_item_click)
+        self.list_widget.itemDoubleClicked.connect(self.list_item_double_click)
+        layout.addWidget(self.list_widget)
 
         self.setLayout(layout)
+        self.set_list_item(list_item)
+
+    def set_list_item(self, list_item):
+        """Refresh the completer and suggestion list from the label history.
+
+        Called by the owner whenever the label history changes, so the
+        dialog never has to be rebuilt.
+        """
+        items = list(list_item) if list_item else []
+        self._completer_model.setStringList(items)
+        self.list_widget.clear()
+        self.list_widget.addItems(items)
+        self.list_widget.setVisible(bool(items))
 
     def validate(self):
         if trimmed(self.edit.text()):
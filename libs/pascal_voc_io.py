@@ -1,5 +1,6 @@
 #!/usr/bin/env python
 # -*- coding: utf8 -*-
+import os
 import sys
 from xml.etree import ElementTree
 from xml.etree.ElementTree import Element, SubElement
@@ -112,16 +113,16 @@ class PascalVocWriter:
     def save(self, target_file=None):
         root = self.gen_xml()
         self.append_objects(root)
-        out_file = None
         if target_file is None:
-            out_file = codecs.open(
-                self.filename + XML_EXT, 'w', encoding=ENCODE_METHOD)
-        else:
-            out_file = codecs.open(target_file, 'w', encoding=ENCODE_METHOD)
+            target_file = self.filename + XML_EXT
 
         prettify_result = self.prettify(root)
-        out_file.write(prettify_result.decode('utf8'))
-        out_file.close()
+        # Write a sibling temp file and atomically swap it in, so an
+        # interrupted save can't leave a truncated annotation behind.
+        tmp_file = target_file + '.tmp'
+        with codecs.open(tmp_file, 'w', encoding=ENCODE_METHOD) as out_file:
+            out_file.write(prettify_result.decode('utf8'))
+        os.replace(tmp_file, target_file)
 
 
 class PascalVocReader:
@@ -150,22 +151,20 @@ class PascalVocReader:
 
     def parse_xml(self):
         assert self.file_path.endswith(XML_EXT), "Unsupported file format"
-        parser = etree.XMLParser(encoding=ENCODE_METHOD)
-        xml_tree = ElementTree.parse(self.file_path, parser=parser).getroot()
-        filename = xml_tree.find('filename').text
-        try:
-            verified = xml_tree.attrib['verified']
-            if verified == 'yes':
-                self.verified = True
-        except KeyError:
-            self.verified = False
-
-        for object_iter in xml_tree.findall('object'):
-            bnd_box = object_iter.find("bndbox")
-            label = object_iter.find('name').text
-            # Add chris
-            difficult = False
-            if object_iter.find('difficult') is not None:
-                difficult = bool(int(object_iter.find('difficult').text))
-            self.add_shape(label, bnd_box, difficult)
+        # Stream the document instead of building the full DOM: each
+        # <object> is consumed and cleared as soon as it is complete, which
+        # keeps memory flat and is much faster for annotation-heavy files.
+        for event, elem in etree.iterparse(self.file_path, events=('start', 'end')):
+            if event == 'start':
+                if elem.tag == 'annotation':
+                    self.verified = elem.attrib.get('verified') == 'yes'
+            elif elem.tag == 'object':
+                bnd_box = elem.find('bndbox')
+                label = elem.find('name').text
+                # Add chris
+                difficult = False
+                if elem.find('difficult') is not None:
+                    difficult = bool(int(elem.find('difficult').text))
+                self.add_shape(label, bnd_box, difficult)
+                elem.clear()
         return True
@@ -39,6 +39,11 @@ class Shape(object):
     label_font_size = 1
     line_width = 2.0  # Configurable bounding box line thickness
 
+    # Shared label font, rebuilt only when label_font_size changes; paint
+    # runs per shape per frame and must not allocate one per call.
+    _label_font = None
+    _label_font_size = None
+
     def __init__(self, label=None, line_color=None, difficult=False, paint_label=False):
         self.label = label
         self.points = []
@@ -121,9 +126,13 @@ class Shape(object):
                     min_x = min(min_x, point.x())
                     min_y = min(min_y, point.y())
                 if min_x != sys.maxsize and min_y != sys.maxsize:
-                    font = QFont()
-                    font.setPointSize(self.label_font_size)
-                    font.setBold(True)
+                    if Shape._label_font_size != self.label_font_size:
+                        font = QFont()
+                        font.setPointSize(self.label_font_size)
+                        font.setBold(True)
+                        Shape._label_font = font
+                        Shape._label_font_size = self.label_font_size
+                    font = Shape._label_font
                     painter.setFont(font)
                     if self.label is None:
                         self.label = ""
@@ -35,10 +35,20 @@ class ToolButton(QToolButton):
         super(ToolButton, self).__init__()
         # Set compact padding for buttons
         self.setStyleSheet("QToolButton { padding: 2px; }")
+        self._size_hint_cache = None
 
     def minimumSizeHint(self):
-        ms = super(ToolButton, self).minimumSizeHint()
-        w1, h1 = ms.width(), ms.height()
-        w2, h2 = self.minSize
-        ToolButton.minSize = max(w1, w2), max(h1, h2)
-        return QSize(*ToolButton.minSize)
+        # Layout passes call this repeatedly; the base hint only changes
+        # with style or font, so cache it and invalidate in changeEvent.
+        if self._size_hint_cache is None:
+            ms = super(ToolButton, self).minimumSizeHint()
+            w1, h1 = ms.width(), ms.height()
+            w2, h2 = self.minSize
+            ToolButton.minSize = max(w1, w2), max(h1, h2)
+            self._size_hint_cache = QSize(*ToolButton.minSize)
+        return self._size_hint_cache
+
+    def changeEvent(self, event):
+        if event.type() in (QEvent.StyleChange, QEvent.FontChange):
+            self._size_hint_cache = None
+        super(ToolButton, self).changeEvent(event)
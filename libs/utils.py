@@ -1,3 +1,4 @@
+from functools import lru_cache
 from math import sqrt
 from libs.ustr import ustr
 import hashlib
@@ -15,8 +16,16 @@ except ImportError:
     QT5 = False
 
 
+# QIcon construction decodes the resource every time; the icon set is
+# small and static, so share one instance per name.
+_icon_cache = {}
+
+
 def new_icon(icon):
-    return QIcon(':/' + icon)
+    cached = _icon_cache.get(icon)
+    if cached is None:
+        cached = _icon_cache[icon] = QIcon(':/' + icon)
+    return cached
 
 
 def new_button(text, icon=None, slot=None):
@@ -70,6 +79,51 @@ class Struct(object):
         self.__dict__.update(kwargs)
 
 
+class BiDict(object):
+    """Two-way mapping whose forward and reverse sides share one write path.
+
+    The forward side behaves like a dict; the paired reverse dict is kept
+    consistent automatically and is reachable as `.rev`.
+    """
+
+    __slots__ = ('fwd', 'rev')
+
+    def __init__(self):
+        self.fwd = {}
+        self.rev = {}
+
+    def __setitem__(self, key, value):
+        self.fwd[key] = value
+        self.rev[value] = key
+
+    def __getitem__(self, key):
+        return self.fwd[key]
+
+    def __contains__(self, key):
+        return key in self.fwd
+
+    def __len__(self):
+        return len(self.fwd)
+
+    def __iter__(self):
+        return iter(self.fwd)
+
+    def get(self, key, default=None):
+        return self.fwd.get(key, default)
+
+    def items(self):
+        return self.fwd.items()
+
+    def pop(self, key):
+        value = self.fwd.pop(key)
+        del self.rev[value]
+        return value
+
+    def clear(self):
+        self.fwd.clear()
+        self.rev.clear()
+
+
 def distance(p):
     return sqrt(p.x() * p.x() + p.y() * p.y())
 
@@ -79,8 +133,13 @@ def format_shortcut(text):
     return '<b>%s</b>+<b>%s</b>' % (mod, key)
 
 
+@lru_cache(maxsize=1024)
 def generate_color_by_text(text):
-    """Generate a bright, vivid color based on text hash using HSV color space."""
+    """Generate a bright, vivid color based on text hash using HSV color space.
+
+    The text -> color hash is pure, so results are memoized; every caller
+    shares the cache rather than re-running the sha256 round-trip.
+    """
     s = ustr(text)
     hash_code = int(hashlib.sha256(s.encode('utf-8')).hexdigest(), 16)
 
@@ -109,14 +168,17 @@ def util_qt_strlistclass():
     return QStringList if have_qstring() else list
 
 
+# Digit-run splitter for natural_sort, compiled once
+_ALPHANUM_RE = re.compile('([0-9]+)')
+
+
 def natural_sort(list, key=lambda s:s):
     """
     Sort the list into natural alphanumeric order.
     """
-    def get_alphanum_key_func(key):
-        convert = lambda text: int(text) if text.isdigit() else text
-        return lambda s: [convert(c) for c in re.split('([0-9]+)', key(s))]
-    sort_key = get_alphanum_key_func(key)
+    def sort_key(s):
+        return [int(c) if c.isdigit() else c
+                for c in _ALPHANUM_RE.split(key(s))]
     list.sort(key=sort_key)
 
 
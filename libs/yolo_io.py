@@ -51,33 +51,25 @@ class YOLOWriter:
 
     def save(self, class_list=[], target_file=None):
 
-        out_file = None  # Update yolo .txt
-        out_class_file = None   # Update class list .txt
-
         if target_file is None:
-            out_file = open(
-            self.filename + TXT_EXT, 'w', encoding=ENCODE_METHOD)
-            classes_file = os.path.join(os.path.dirname(os.path.abspath(self.filename)), "classes.txt")
-            out_class_file = open(classes_file, 'w')
-
-        else:
-            out_file = codecs.open(target_file, 'w', encoding=ENCODE_METHOD)
-            classes_file = os.path.join(os.path.dirname(os.path.abspath(target_file)), "classes.txt")
-            out_class_file = open(classes_file, 'w')
-
-
-        for box in self.box_list:
-            class_index, x_center, y_center, w, h = self.bnd_box_to_yolo_line(box, class_list)
-            # print (classIndex, x_center, y_center, w, h)
-            out_file.write("%d %.6f %.6f %.6f %.6f\n" % (class_index, x_center, y_center, w, h))
-
-        # print (classList)
-        # print (out_class_file)
-        for c in class_list:
-            out_class_file.write(c+'\n')
-
-        out_class_file.close()
-        out_file.close()
+            target_file = self.filename + TXT_EXT
+        classes_file = os.path.join(os.path.dirname(os.path.abspath(target_file)), "classes.txt")
+
+        # Write sibling temp files and atomically swap them in, so an
+        # interrupted save can't leave truncated annotations behind.
+        tmp_file = target_file + '.tmp'
+        with codecs.open(tmp_file, 'w', encoding=ENCODE_METHOD) as out_file:
+            for box in self.box_list:
+                class_index, x_center, y_center, w, h = self.bnd_box_to_yolo_line(box, class_list)
+                # print (classIndex, x_center, y_center, w, h)
+                out_file.write("%d %.6f %.6f %.6f %.6f\n" % (class_index, x_center, y_center, w, h))
+        os.replace(tmp_file, target_file)
+
+        tmp_classes_file = classes_file + '.tmp'
+        with open(tmp_classes_file, 'w') as out_class_file:
+            for c in class_list:
+                out_class_file.write(c+'\n')
+        os.replace(tmp_classes_file, classes_file)
 
 
 